@@ -4,9 +4,14 @@ from typing import Optional, List
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Channel:
-    """Represents an IPTV channel."""
+    """Represents an IPTV channel.
+    
+    Slotted: an Xtream account can hold tens of thousands of channels, so
+    the per-instance ``__dict__`` is worth dropping. Not frozen, since
+    favourites and watch history are updated in place.
+    """
     
     name: str
     url: str
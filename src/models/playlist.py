@@ -13,6 +13,11 @@ class Playlist:
     channels: List[Channel] = field(default_factory=list)
     metadata: dict = field(default_factory=dict)  # Store provider info (e.g. Xtream creds)
     
+    @property
+    def channel_count(self) -> int:
+        """Number of channels; always in sync with the channel list."""
+        return len(self.channels)
+    
     def get_groups(self) -> List[str]:
         """Get all unique group names from channels."""
         groups = set()
@@ -257,7 +257,7 @@ class IPTVMainWindow(QMainWindow):
         self._player_view.play_channel(channel)
 
     async def _load_xtream_series(self, channel: Channel):
-        from .services.xtream_client import XtreamCodesClient, XtreamCredentials
+        from .services.xtream_client import XtreamCodesClient, XtreamCredentials, normalize_server
 
         self._player_view.show_loading("Loading series...")
         try:
@@ -267,7 +267,7 @@ class IPTVMainWindow(QMainWindow):
 
             metadata = dict(playlist.metadata or {})
             if not metadata.get("password"):
-                server = metadata.get("server", "")
+                server = normalize_server(metadata.get("server", ""))
                 username = metadata.get("username", "")
                 for provider in self.state.get_xtream_providers():
                     if provider.get("server") == server and provider.get("username") == username:
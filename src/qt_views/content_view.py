@@ -12,6 +12,8 @@ import qtawesome as qta
 from ..services.state_manager import StateManager
 from ..models.channel import Channel
 
+_ROW_SIZE = QSize(0, 64)
+
 
 def _language_name(code: str) -> str:
     """Convert ISO-639-1/2 language code to readable name."""
@@ -125,7 +127,10 @@ class ContentView(QWidget):
         filter_row.addWidget(self._search_edit, 1)
 
         self._fav_btn = QPushButton("  Favorites")
-        self._fav_btn.setIcon(qta.icon("mdi.heart-outline", color="#f472b6"))
+        # Rendered once; the filter toggle and every favorite row reuse them
+        self._fav_icon_on  = qta.icon("mdi.heart",         color="#f472b6")
+        self._fav_icon_off = qta.icon("mdi.heart-outline", color="#f472b6")
+        self._fav_btn.setIcon(self._fav_icon_off)
         self._fav_btn.setIconSize(QSize(16, 16))
         self._fav_btn.setCheckable(True)
         self._fav_btn.clicked.connect(self._toggle_favorites)
@@ -189,7 +194,7 @@ class ContentView(QWidget):
 
     def _toggle_favorites(self, checked: bool):
         self._show_favorites_only = checked
-        self._fav_btn.setIcon(qta.icon("mdi.heart" if checked else "mdi.heart-outline", color="#f472b6"))
+        self._fav_btn.setIcon(self._fav_icon_on if checked else self._fav_icon_off)
         self._apply_filters()
 
     def _on_search_text_changed(self, text: str):
@@ -233,24 +238,30 @@ class ContentView(QWidget):
         self._is_updating = False
 
     def _load_batch(self, start: int, end: int):
-        for i in range(start, end):
-            ch = self._filtered[i]
-            # Build display text based on context
-            if self._search_query:
-                # Searching across all categories — show group badge
-                text = f"{ch.name}\n📁 {ch.group}"
-            elif self._selected_category != "All":
-                # Already filtered to one category — no need to repeat the group
-                text = ch.name
-            else:
-                # "All" view — show name + group for visual grouping
-                text = f"{ch.name}\n{ch.group}"
-            item = QListWidgetItem(text)
-            if ch.is_favorite:
-                item.setIcon(qta.icon("mdi.heart", color="#f472b6"))
-            item.setData(Qt.UserRole, ch)
-            item.setSizeHint(QSize(0, 64))
-            self._channel_list.addItem(item)
+        lst = self._channel_list
+        # Stage the whole page of rows and repaint the list once
+        lst.setUpdatesEnabled(False)
+        try:
+            for i in range(start, end):
+                ch = self._filtered[i]
+                # Build display text based on context
+                if self._search_query:
+                    # Searching across all categories — show group badge
+                    text = f"{ch.name}\n📁 {ch.group}"
+                elif self._selected_category != "All":
+                    # Already filtered to one category — no need to repeat the group
+                    text = ch.name
+                else:
+                    # "All" view — show name + group for visual grouping
+                    text = f"{ch.name}\n{ch.group}"
+                item = QListWidgetItem(text)
+                if ch.is_favorite:
+                    item.setIcon(self._fav_icon_on)
+                item.setData(Qt.UserRole, ch)
+                item.setSizeHint(_ROW_SIZE)
+                lst.addItem(item)
+        finally:
+            lst.setUpdatesEnabled(True)
         self._displayed_count = end
 
     def _load_more(self):
@@ -1,16 +1,44 @@
 """Series view with seasons and episodes."""
-from typing import Optional, Callable, List, Dict
+import re
+from typing import Optional, Callable, List, Dict, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QComboBox, QListWidget, QListWidgetItem, QSplitter, QFrame,
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QSignalBlocker, QTimer
 import qtawesome as qta
 
 from ..services.state_manager import StateManager
 from ..models.channel import Channel
 
 
+_ROW_SIZE = QSize(0, 52)
+# The token plus the separators around it, so "Show - S01E01 - Pilot" leaves one
+_SXXEXX_RE = re.compile(r'\s*[-.]?\s*s\d{1,2}\s*e\d{1,2}\s*[-.]?\s*', re.IGNORECASE)
+
+
+def _episode_sort_key(ep: Channel) -> int:
+    return ep.episode if ep.episode else 999
+
+
+def _episode_title(ep: Channel) -> str:
+    if ep.season and ep.episode:
+        return f"S{ep.season:02d}E{ep.episode:02d}  •  {_clean_episode_name(ep.name)}"
+    if ep.episode:
+        return f"E{ep.episode:02d}  •  {ep.name}"
+    return ep.name
+
+
+def _clean_episode_name(name: str) -> str:
+    """Strip the SxxExx token already shown in the row prefix."""
+    # Cheap substring check first; most names never reach the regex engine
+    upper = name.upper()
+    if 'S' in upper and 'E' in upper:
+        cleaned = " ".join(_SXXEXX_RE.sub(" - ", name).split()).strip(" -.")
+        return cleaned or name
+    return name
+
+
 class SeriesView(QWidget):
     """View for series seasons and episodes."""
 
@@ -24,8 +52,16 @@ class SeriesView(QWidget):
         self._on_play_episode = on_play_episode
         self._series_name: str = ""
         self._episodes: List[Channel] = []
-        self._seasons: Dict[int, List[Channel]] = {}
-        self._sorted_seasons: List[int] = []
+        # (season number, sorted episodes, row titles) in combo order
+        self._season_items: List[Tuple[int, List[Channel], List[str]]] = []
+        self._season_key: tuple = ()
+
+        # Episode rows are filled on the next event-loop pass so the header
+        # and season selector paint first when a series is opened.
+        self._episode_loader = QTimer(self)
+        self._episode_loader.setSingleShot(True)
+        self._episode_loader.setInterval(0)
+        self._episode_loader.timeout.connect(self._update_episode_list)
 
         self._setup_ui()
 
@@ -42,7 +78,7 @@ class SeriesView(QWidget):
         back_btn = QPushButton("  Back")
         back_btn.setIcon(qta.icon("mdi.arrow-left", color="#a855f7"))
         back_btn.setIconSize(QSize(18, 18))
-        back_btn.clicked.connect(lambda: self._on_back() if self._on_back else None)
+        back_btn.clicked.connect(self._handle_back)
         h_layout.addWidget(back_btn)
         self._title_label = QLabel("Series")
         self._title_label.setStyleSheet("font-size: 20px; font-weight: 700;")
@@ -102,41 +138,80 @@ class SeriesView(QWidget):
         self._meta_name.setText(series_name)
 
         # Group by season
-        self._seasons = {}
+        seasons: Dict[int, List[Channel]] = {}
         unknown = []
         for ep in episodes:
             if ep.season:
-                self._seasons.setdefault(ep.season, []).append(ep)
+                seasons.setdefault(ep.season, []).append(ep)
             else:
                 unknown.append(ep)
         if unknown:
-            if not self._seasons:
-                self._seasons[1] = unknown
+            if not seasons:
+                seasons[1] = unknown
             else:
-                self._seasons[0] = unknown
-
-        self._sorted_seasons = sorted(self._seasons.keys())
-        self._season_combo.clear()
-        for s in self._sorted_seasons:
-            label = f"Season {s}" if s > 0 else "Extras"
-            self._season_combo.addItem(label, s)
-
-        self._meta_count.setText(f"{len(self._seasons)} Season(s)  •  {len(episodes)} Episode(s)")
-        self._update_episode_list()
+                seasons[0] = unknown
+
+        # Sort and format each season once; season switches only rebind rows
+        self._season_items = []
+        for season in sorted(seasons):
+            eps = seasons[season]
+            eps.sort(key=_episode_sort_key)
+            self._season_items.append((season, eps, [_episode_title(ep) for ep in eps]))
+        self._update_season_combo()
+
+        self._meta_count.setText(f"{len(self._season_items)} Season(s)  •  {len(episodes)} Episode(s)")
+        self._episode_loader.start()
+
+    def _update_season_combo(self):
+        # Repopulating the combo fires currentIndexChanged per item; block it so
+        # the episode list is rebuilt exactly once by the deferred loader.
+        key = tuple(season for season, _, _ in self._season_items)
+        with QSignalBlocker(self._season_combo):
+            if key != self._season_key:
+                self._season_key = key
+                self._season_combo.clear()
+                for s in key:
+                    label = f"Season {s}" if s > 0 else "Extras"
+                    self._season_combo.addItem(label, s)
+            else:
+                # Same season layout (e.g. reopening a series): keep the items
+                self._season_combo.setCurrentIndex(0)
 
     def _update_episode_list(self):
-        self._episode_list.clear()
-        season = self._season_combo.currentData()
-        eps = self._seasons.get(season, [])
-        eps.sort(key=lambda x: x.episode if x.episode else 999)
-        for ep in eps:
-            label = f"S{ep.season:02d}E{ep.episode:02d}  •  {ep.name}" if ep.season and ep.episode else ep.name
-            item = QListWidgetItem(label)
-            item.setData(Qt.UserRole, ep)
-            item.setSizeHint(QSize(0, 52))
-            self._episode_list.addItem(item)
+        index = self._season_combo.currentIndex()
+        if 0 <= index < len(self._season_items):
+            _, eps, titles = self._season_items[index]
+        else:
+            eps, titles = [], []
+        lst = self._episode_list
+        # Repaint the list once after all rows are in place
+        lst.setUpdatesEnabled(False)
+        try:
+            # Rows are pooled: grow to the largest season seen, then rebind
+            # text/data in place and hide the surplus on season switches.
+            for _ in range(lst.count(), len(eps)):
+                item = QListWidgetItem()
+                item.setSizeHint(_ROW_SIZE)
+                lst.addItem(item)
+            for i in range(lst.count()):
+                item = lst.item(i)
+                if i < len(eps):
+                    item.setText(titles[i])
+                    item.setData(Qt.UserRole, eps[i])
+                    item.setHidden(False)
+                else:
+                    item.setData(Qt.UserRole, None)
+                    item.setHidden(True)
+        finally:
+            lst.setUpdatesEnabled(True)
+        lst.scrollToTop()
+
+    def _handle_back(self):
+        if self._on_back:
+            self._on_back()
 
     def _on_season_change(self, index: int):
+        self._episode_loader.stop()
         self._update_episode_list()
 
     def _on_episode_clicked(self, item: QListWidgetItem):
@@ -159,13 +234,10 @@ class SeriesView(QWidget):
 
 
     def _play_first(self):
-        if not self._sorted_seasons:
-            return
-        first_season = self._seasons.get(self._sorted_seasons[0], [])
-        if first_season:
-            first_season.sort(key=lambda x: x.episode if x.episode else 999)
-            if self._on_play_episode:
-                self._on_play_episode(first_season[0])
+        # Season buckets are sorted once in load_series
+        first = self._season_items[0][1] if self._season_items else None
+        if first and self._on_play_episode:
+            self._on_play_episode(first[0])
 
     def episodes(self) -> List[Channel]:
         return self._episodes
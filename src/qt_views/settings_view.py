@@ -1,17 +1,94 @@
 """Settings view for playlist and provider management."""
 import asyncio
-from typing import Optional, Callable
+import hashlib
+import re
+import time
+from urllib.parse import urlparse
+from typing import Optional, Callable, Dict, List, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, QListWidget, QListWidgetItem, QMessageBox,
-    QFileDialog, QTabWidget, QFormLayout, QGroupBox,
+    QFileDialog, QTabWidget, QFormLayout, QGroupBox, QProgressBar,
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer
 import qtawesome as qta
 
+from ..models.playlist import Playlist
 from ..services.state_manager import StateManager
 from ..services.m3u_parser import M3UParser
-from ..services.xtream_client import XtreamCodesClient, XtreamCredentials
+from ..services.xtream_client import XtreamCodesClient, XtreamCredentials, normalize_server
+
+_INV_MB = 1.0 / (1024 * 1024)
+# Download progress repaints at most this often (seconds), and only once the
+# bar moves a whole percent or the MB readout moves by _PROGRESS_MIN_BYTES
+_PROGRESS_INTERVAL = 0.1
+_PROGRESS_MIN_BYTES = 1 << 20
+
+# Xtream servers may omit the scheme; the client adds http:// itself
+_XTREAM_SERVER_RE = re.compile(r'^(?:https?://)?[\w.-]+(?::\d+)?(?:/\S*)?$', re.I)
+
+# Background refresh: every tick, providers last downloaded more than
+# xtream_refresh_secs ago are fetched again
+_XTREAM_REFRESH_SECS = 6 * 3600
+_XTREAM_REFRESH_TICK_MS = 5 * 60 * 1000
+# A provider whose download failed is not retried in the background for this
+# long, doubling with each further failure up to the cap
+_XTREAM_RETRY_SECS = 5 * 60
+_XTREAM_RETRY_MAX_SECS = 6 * 3600
+# Providers downloaded at once by Refresh All; each one issues four API requests,
+# which matches the shared client's connection cap
+_XTREAM_REFRESH_CONCURRENCY = 8
+
+
+def _channels_digest(channels) -> bytes:
+    """Cheap fingerprint of a catalogue.
+
+    Covers the fields StateManager.update_playlist compares (URL, name, logo,
+    group, content type), so any change it would apply alters the digest.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for ch in channels:
+        h.update("\0".join((ch.url, ch.name, ch.logo or "", ch.group or "", ch.content_type or "")).encode())
+        h.update(b"\n")
+    return h.digest()
+
+
+_TITLE_STYLE = "font-size: 20px; font-weight: 700;"
+_BACK_ICON_SIZE = QSize(18, 18)
+
+
+def _build_header(title: str, on_back: Callable[[], None]) -> QWidget:
+    """Build the view header: back button plus title."""
+    header = QWidget()
+    header.setObjectName("viewHeader")
+    header_layout = QHBoxLayout(header)
+    header_layout.setContentsMargins(16, 10, 16, 10)
+    back_btn = QPushButton("  Back")
+    back_btn.setIcon(qta.icon("mdi.arrow-left", color="#a855f7"))
+    back_btn.setIconSize(_BACK_ICON_SIZE)
+    back_btn.clicked.connect(on_back)
+    header_layout.addWidget(back_btn)
+    title_label = QLabel(title)
+    title_label.setStyleSheet(_TITLE_STYLE)
+    header_layout.addWidget(title_label)
+    header_layout.addStretch()
+    return header
+
+
+def _button(text: str, slot: Callable[[], None], primary: bool = False) -> QPushButton:
+    btn = QPushButton(text)
+    if primary:
+        btn.setObjectName("primary")
+    btn.clicked.connect(slot)
+    return btn
+
+
+def _placeholder(text: str) -> QLabel:
+    """Empty-state label shown in place of a list; hidden until needed."""
+    label = QLabel(text)
+    label.setAlignment(Qt.AlignCenter)
+    label.setVisible(False)
+    return label
 
 
 class SettingsView(QWidget):
@@ -23,29 +100,50 @@ class SettingsView(QWidget):
         super().__init__(parent)
         self._state = state_manager
         self._on_back = on_back
+        self._playlist_items: Dict[int, QListWidgetItem] = {}  # id(playlist) -> row
+        self._provider_items: Dict[Tuple[str, str], QListWidgetItem] = {}  # (server, username) -> row
+        # Downloads in progress, keyed by the full credentials, shared by
+        # every caller asking for the same provider meanwhile
+        self._xtream_inflight: Dict[Tuple[str, str, str], asyncio.Task] = {}
+        self._refresh_task: Optional[asyncio.Task] = None  # Refresh All click
+        self._background_refresh_task: Optional[asyncio.Task] = None  # scheduler tick
+        # (server, username) -> (next background attempt, current delay) after failures
+        self._xtream_retry: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._last_progress_update = 0.0
+        self._last_progress_percent = -1
+        self._last_progress_bytes = 0
+        self._add_task: Optional[asyncio.Task] = None  # in-flight URL add
+
+        # Elapsed-time ticker shown while a local file is parsed off-thread
+        self._loading_started = 0.0
+        self._loading_timer = QTimer(self)
+        self._loading_timer.setInterval(250)
+        self._loading_timer.timeout.connect(self._tick_loading)
+
+        # Background adds/refreshes request a list refresh; requests landing in
+        # the same frame are served by one pass
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(16)
+        self._refresh_timer.timeout.connect(self._refresh_lists)
+
+        # Keeps provider catalogues current without the user asking; the
+        # stored playlists are shown meanwhile
+        self._xtream_timer = QTimer(self)
+        self._xtream_timer.setInterval(_XTREAM_REFRESH_TICK_MS)
+        self._xtream_timer.timeout.connect(self._refresh_due_xtream)
+        self._xtream_timer.start()
+
         self._setup_ui()
-        self._refresh_lists()
+        # The view is built at startup but rarely shown; fill the lists on first show
+        self._lists_dirty = True
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(16)
 
-        # Header
-        header = QWidget()
-        header.setObjectName("viewHeader")
-        header_layout = QHBoxLayout(header)
-        header_layout.setContentsMargins(16, 10, 16, 10)
-        back_btn = QPushButton("  Back")
-        back_btn.setIcon(qta.icon("mdi.arrow-left", color="#a855f7"))
-        back_btn.setIconSize(QSize(18, 18))
-        back_btn.clicked.connect(lambda: self._on_back() if self._on_back else None)
-        header_layout.addWidget(back_btn)
-        title = QLabel("Settings")
-        title.setStyleSheet("font-size: 20px; font-weight: 700;")
-        header_layout.addWidget(title)
-        header_layout.addStretch()
-        layout.addWidget(header)
+        layout.addWidget(_build_header("Settings", self._handle_back))
 
         tabs = QTabWidget()
 
@@ -59,26 +157,54 @@ class SettingsView(QWidget):
         self._url_edit = QLineEdit()
         self._url_edit.setPlaceholderText("https://example.com/playlist.m3u")
         url_form.addRow("URL:", self._url_edit)
-        add_url_btn = QPushButton("Add from URL")
-        add_url_btn.setObjectName("primary")
-        add_url_btn.clicked.connect(self._add_from_url)
-        url_form.addRow(add_url_btn)
-
-        add_file_btn = QPushButton("Add from File")
-        add_file_btn.clicked.connect(self._add_from_file)
-        url_form.addRow(add_file_btn)
+        url_form.addRow(_button("Add from URL", self._add_from_url, primary=True))
+        url_form.addRow(_button("Add from File", self._add_from_file))
+
+        self._progress_bar = QProgressBar()
+        self._progress_bar.setVisible(False)
+        url_form.addRow(self._progress_bar)
+        self._download_info = QLabel("")
+        self._download_info.setVisible(False)
+        url_form.addRow(self._download_info)
         pl_layout.addWidget(url_group)
 
         # Playlists list
         pl_layout.addWidget(QLabel("Your Playlists"))
+        self._empty_playlists = _placeholder("No playlists added yet. Add an M3U URL or file above.")
+        pl_layout.addWidget(self._empty_playlists)
         self._playlist_list = QListWidget()
+        self._configure_list(self._playlist_list)
         self._playlist_list.itemClicked.connect(self._remove_playlist_prompt)
         pl_layout.addWidget(self._playlist_list)
         layout.addWidget(tabs)
 
-        # Xtream tab
-        xt_tab = QWidget()
-        xt_layout = QVBoxLayout(xt_tab)
+        # Xtream tab: most users only add M3U playlists, so its form and
+        # provider list are built the first time the tab is opened
+        self._xt_tab = QWidget()
+        self._provider_list: Optional[QListWidget] = None
+        self._empty_providers: Optional[QLabel] = None
+
+        # Data tab
+        data_tab = QWidget()
+        data_layout = QVBoxLayout(data_tab)
+        data_layout.addWidget(_button("Clear Favorites", self._clear_favorites))
+        data_layout.addWidget(_button("Clear Recently Viewed", self._clear_recent))
+        data_layout.addWidget(_button("Clear Playback Positions", self._clear_positions))
+        data_layout.addStretch()
+
+        tabs.addTab(pl_tab, "Playlists")
+        tabs.addTab(self._xt_tab, "Xtream")
+        tabs.addTab(data_tab, "Data")
+        tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _on_tab_changed(self, index: int):
+        if index == 1:
+            self._ensure_xtream_built()
+
+    def _ensure_xtream_built(self):
+        if self._provider_list is not None:
+            return
+        xt_layout = QVBoxLayout(self._xt_tab)
 
         xt_group = QGroupBox("Add Xtream Codes Provider")
         xt_form = QFormLayout(xt_group)
@@ -92,66 +218,188 @@ class SettingsView(QWidget):
         self._xt_pass = QLineEdit()
         self._xt_pass.setEchoMode(QLineEdit.Password)
         xt_form.addRow("Password:", self._xt_pass)
-        add_xt_btn = QPushButton("Add Provider")
-        add_xt_btn.setObjectName("primary")
-        add_xt_btn.clicked.connect(self._add_xtream)
-        xt_form.addRow(add_xt_btn)
+        xt_form.addRow(_button("Add Provider", self._add_xtream, primary=True))
         xt_layout.addWidget(xt_group)
 
-        xt_layout.addWidget(QLabel("Your Providers"))
+        providers_header = QHBoxLayout()
+        providers_header.addWidget(QLabel("Your Providers"))
+        providers_header.addStretch()
+        providers_header.addWidget(_button("Refresh All", self._refresh_all_xtream))
+        xt_layout.addLayout(providers_header)
+        self._empty_providers = _placeholder("No providers added yet. Fill in the form above.")
+        xt_layout.addWidget(self._empty_providers)
         self._provider_list = QListWidget()
+        self._configure_list(self._provider_list)
         self._provider_list.itemClicked.connect(self._remove_provider_prompt)
         xt_layout.addWidget(self._provider_list)
+        self._refresh_provider_list()
 
-        # Data tab
-        data_tab = QWidget()
-        data_layout = QVBoxLayout(data_tab)
-        clear_fav = QPushButton("Clear Favorites")
-        clear_fav.clicked.connect(self._clear_favorites)
-        data_layout.addWidget(clear_fav)
-        clear_recent = QPushButton("Clear Recently Viewed")
-        clear_recent.clicked.connect(self._clear_recent)
-        data_layout.addWidget(clear_recent)
-        clear_positions = QPushButton("Clear Playback Positions")
-        clear_positions.clicked.connect(self._clear_positions)
-        data_layout.addWidget(clear_positions)
-        data_layout.addStretch()
+    def _handle_back(self):
+        if self._on_back:
+            self._on_back()
 
-        tabs.addTab(pl_tab, "Playlists")
-        tabs.addTab(xt_tab, "Xtream")
-        tabs.addTab(data_tab, "Data")
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._lists_dirty:
+            self._lists_dirty = False
+            self._refresh_lists()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # Leaving the view (Back, Esc, any navigation) abandons a pending URL add
+        # rather than finishing it unseen; minimizing the window is not leaving
+        if not event.spontaneous():
+            self._cancel_add_task()
+
+    @staticmethod
+    def _configure_list(widget: QListWidget):
+        # Rows are single-line text, so a fixed row extent lets Qt lay out only
+        # the visible window instead of measuring every item.
+        widget.setUniformItemSizes(True)
+        widget.setLayoutMode(QListWidget.Batched)
+        widget.setBatchSize(50)
+
+    def _schedule_refresh(self):
+        if self.isVisible():
+            self._refresh_timer.start()
+        else:
+            self._lists_dirty = True
 
     def _refresh_lists(self):
-        self._playlist_list.clear()
-        for pl in self._state.get_playlists():
-            item = QListWidgetItem(f"{pl.name} ({len(pl.channels)} channels)")
-            item.setData(Qt.UserRole, pl)
-            self._playlist_list.addItem(item)
-
-        self._provider_list.clear()
-        for p in self._state.get_xtream_providers():
-            name = p.get("name", "Unknown")
-            server = p.get("server", "")
-            item = QListWidgetItem(f"{name} ({server})")
-            item.setData(Qt.UserRole, p)
-            self._provider_list.addItem(item)
+        self._refresh_timer.stop()
+        self._refresh_playlist_list()
+        self._refresh_provider_list()
+
+    def _refresh_playlist_list(self):
+        """Patch playlist rows in place: drop removed, append new, relabel changed."""
+        playlists = self._state.get_playlists()
+        lst = self._playlist_list
+        live = {id(pl) for pl in playlists}
+        # Repaint the list once after all rows are patched
+        lst.setUpdatesEnabled(False)
+        try:
+            for key in [k for k in self._playlist_items if k not in live]:
+                item = self._playlist_items.pop(key)
+                lst.takeItem(lst.row(item))
+
+            # New playlists are appended by the state manager, so appending keeps order
+            for pl in playlists:
+                text = f"{pl.name} ({pl.channel_count} channels)"
+                item = self._playlist_items.get(id(pl))
+                if item is None:
+                    item = QListWidgetItem(text)
+                    item.setData(Qt.UserRole, pl)
+                    lst.addItem(item)
+                    self._playlist_items[id(pl)] = item
+                elif item.text() != text:
+                    item.setText(text)
+        finally:
+            lst.setUpdatesEnabled(True)
+        self._update_empty_state()
+
+    def _update_empty_state(self):
+        # The placeholders are built once in _setup_ui and only toggled here
+        for placeholder, lst in ((self._empty_playlists, self._playlist_list),
+                                 (self._empty_providers, self._provider_list)):
+            if lst is None:
+                continue
+            empty = lst.count() == 0
+            placeholder.setVisible(empty)
+            lst.setVisible(not empty)
+
+    def _refresh_provider_list(self):
+        """Patch provider rows in place, keyed like the state manager by server+username."""
+        lst = self._provider_list
+        if lst is None:
+            return  # Tab not opened yet; it fills itself when built
+        providers = self._state.get_xtream_providers()
+        live = {(p.get("server", ""), p.get("username", "")) for p in providers}
+        lst.setUpdatesEnabled(False)
+        try:
+            for key in [k for k in self._provider_items if k not in live]:
+                item = self._provider_items.pop(key)
+                lst.takeItem(lst.row(item))
+
+            for p in providers:
+                key = (p.get("server", ""), p.get("username", ""))
+                text = f"{p.get('name', 'Unknown')} ({key[0]})"
+                item = self._provider_items.get(key)
+                if item is None:
+                    item = QListWidgetItem(text)
+                    lst.addItem(item)
+                    self._provider_items[key] = item
+                elif item.text() != text:
+                    item.setText(text)
+                # Re-adding a provider updates its stored credentials in place
+                item.setData(Qt.UserRole, p)
+        finally:
+            lst.setUpdatesEnabled(True)
+        self._update_empty_state()
 
     def _add_from_url(self):
         url = self._url_edit.text().strip()
         if not url:
             QMessageBox.warning(self, "Missing URL", "Please enter a playlist URL")
             return
-        asyncio.create_task(self._do_add_url(url))
+        # Reject malformed input here instead of after a DNS/connect timeout
+        parsed = urlparse(url)
+        if parsed.scheme.lower() not in ("http", "https") or not parsed.netloc:
+            QMessageBox.warning(self, "Invalid URL", "Please enter an http(s) playlist URL")
+            return
+        # A new add supersedes one still downloading
+        self._cancel_add_task()
+        self._add_task = asyncio.create_task(self._do_add_url(url))
+
+    def _cancel_add_task(self):
+        if self._add_task is not None and not self._add_task.done():
+            self._add_task.cancel()
+        self._add_task = None
 
     async def _do_add_url(self, url: str):
+        self._last_progress_update = 0.0
+        self._last_progress_percent = -1
+        self._last_progress_bytes = 0
+        # Busy until the first callback brings a total; chunked responses may never
+        self._progress_bar.setRange(0, 0)
+        self._progress_bar.setVisible(True)
+        self._download_info.setText("Downloading...")
+        self._download_info.setVisible(True)
         try:
-            playlist = await M3UParser.parse_from_url(url)
+            playlist = await M3UParser.parse_from_url(url, progress_callback=self._update_progress)
             self._state.add_playlist(playlist)
             self._url_edit.clear()
-            self._refresh_lists()
-            QMessageBox.information(self, "Success", f"Added {len(playlist.channels)} channels")
+            self._schedule_refresh()
+            self._show_added(playlist)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load playlist: {e}")
+        finally:
+            self._progress_bar.setVisible(False)
+            self._progress_bar.setRange(0, 100)
+            self._download_info.setVisible(False)
+
+    def _update_progress(self, downloaded: int, total: int):
+        """Download progress callback, called by the parser once per chunk."""
+        # Chunks arrive far faster than the bar can visibly move; skip repaints
+        # that would show nothing new or come sooner than _PROGRESS_INTERVAL.
+        if downloaded >= total:
+            # Download finished; parsing runs off-thread, so show a busy bar
+            self._progress_bar.setRange(0, 0)
+            self._download_info.setText("Parsing channels...")
+            return
+        now = time.monotonic()
+        if now - self._last_progress_update < _PROGRESS_INTERVAL:
+            return
+        percent = int(downloaded * 100 / total)
+        if (percent == self._last_progress_percent
+                and downloaded - self._last_progress_bytes < _PROGRESS_MIN_BYTES):
+            return
+        self._last_progress_percent = percent
+        self._last_progress_bytes = downloaded
+        self._last_progress_update = now
+        if self._progress_bar.maximum() == 0:
+            self._progress_bar.setRange(0, 100)
+        self._progress_bar.setValue(percent)
+        self._download_info.setText(f"{downloaded * _INV_MB:.1f} MB / {total * _INV_MB:.1f} MB")
 
     def _add_from_file(self):
         path, _ = QFileDialog.getOpenFileName(self, "Select M3U Playlist", "", "M3U Files (*.m3u *.m3u8);;All Files (*)")
@@ -159,13 +407,41 @@ class SettingsView(QWidget):
             asyncio.create_task(self._do_add_file(path))
 
     async def _do_add_file(self, path: str):
+        # Parsing runs in a worker thread, so the busy bar keeps animating
+        self._set_loading(True)
         try:
             playlist = await M3UParser.parse_from_file(path)
             self._state.add_playlist(playlist)
-            self._refresh_lists()
-            QMessageBox.information(self, "Success", f"Added {len(playlist.channels)} channels")
+            self._schedule_refresh()
+            self._show_added(playlist)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load file: {e}")
+        finally:
+            self._set_loading(False)
+
+    def _set_loading(self, on: bool):
+        """Toggle the busy indicator shown while a local file is parsed."""
+        # A 0..0 range puts the bar in busy mode, which animates on a style
+        # timer; the determinate range is restored whenever it goes idle.
+        if on:
+            self._progress_bar.setRange(0, 0)
+            self._download_info.setText("Loading file...")
+            self._loading_started = time.monotonic()
+            self._loading_timer.start()
+        else:
+            self._loading_timer.stop()
+            self._progress_bar.setRange(0, 100)
+        self._progress_bar.setVisible(on)
+        self._download_info.setVisible(on)
+
+    def _show_added(self, playlist: Playlist, extra: str = ""):
+        QMessageBox.information(
+            self, "Success", f"Added {playlist.channel_count} channels from {playlist.name}{extra}"
+        )
+
+    def _tick_loading(self):
+        elapsed = time.monotonic() - self._loading_started
+        self._download_info.setText(f"Loading file... {elapsed:.1f}s")
 
     def _add_xtream(self):
         creds = XtreamCredentials(
@@ -177,42 +453,183 @@ class SettingsView(QWidget):
         if not all([creds.server, creds.username, creds.password]):
             QMessageBox.warning(self, "Missing Fields", "Please fill all Xtream fields")
             return
+        if not _XTREAM_SERVER_RE.match(creds.server):
+            QMessageBox.warning(self, "Invalid Server", "Please enter a server like http://example.com:8080")
+            return
+        # Store one spelling per server so re-adding updates the same provider
+        creds.server = normalize_server(creds.server)
         asyncio.create_task(self._do_add_xtream(creds))
 
     async def _do_add_xtream(self, creds: XtreamCredentials):
         try:
-            client = XtreamCodesClient(creds)
-            info = await client.authenticate()
-            channels = await client.get_all_channels()
-            from ..models.playlist import Playlist
-            pl = Playlist(
-                name=creds.name,
-                source=creds.server,
-                channels=channels,
-                metadata=creds.to_dict(),
-            )
-            self._state.add_playlist(pl)
-            self._state.add_xtream_provider(creds)
+            info, pl = await self._fetch_provider_shared(creds)
+            with self._state.batch_update():
+                self._store_provider_playlist(pl)
+                self._state.add_xtream_provider(creds)
             self._xt_name.clear()
             self._xt_server.clear()
             self._xt_user.clear()
             self._xt_pass.clear()
-            self._refresh_lists()
-            QMessageBox.information(self, "Success", f"Added {len(channels)} channels\nStatus: {info.status}")
+            self._schedule_refresh()
+            self._show_added(pl, f"\nStatus: {info.status}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to add provider: {e}")
 
+    def _refresh_all_xtream(self):
+        # Repeated clicks while a refresh runs join it instead of starting another.
+        # A background run does not count: it only covers due providers and
+        # reports nothing, and _fetch_provider_shared joins its downloads.
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._do_refresh_all_xtream())
+
+    def _refresh_due_xtream(self):
+        # A refresh already running (user or scheduled) covers this tick
+        for task in (self._refresh_task, self._background_refresh_task):
+            if task is not None and not task.done():
+                return
+        self._background_refresh_task = asyncio.create_task(self._do_refresh_all_xtream(force=False))
+
+    async def _do_refresh_all_xtream(self, force: bool = True):
+        """Re-download every provider's catalogue concurrently and store the results once.
+
+        Without ``force`` this is a background refresh: only providers whose
+        playlist is still stored and older than the ``xtream_refresh_secs``
+        setting are fetched, a playlist the user removed is not brought back,
+        and the outcome is logged rather than shown.
+        """
+        providers = [XtreamCredentials.from_dict(p) for p in self._state.get_xtream_providers()]
+        if not force:
+            ttl = self._state.get_setting("xtream_refresh_secs", _XTREAM_REFRESH_SECS)
+            now = time.time()
+            mono = time.monotonic()
+            providers = [
+                c for c in providers
+                if now - self._provider_fetched_at(c) >= ttl
+                and self._xtream_retry.get((c.server, c.username), (0.0, 0.0))[0] <= mono
+            ]
+        if not providers:
+            return
+        sem = asyncio.Semaphore(_XTREAM_REFRESH_CONCURRENCY)
+
+        async def fetch(creds: XtreamCredentials):
+            async with sem:
+                return await self._fetch_provider_shared(creds)
+
+        results = await asyncio.gather(*(fetch(creds) for creds in providers), return_exceptions=True)
+        failed: List[str] = []
+        changed = False
+        with self._state.batch_update():
+            for creds, result in zip(providers, results):
+                key = (creds.server, creds.username)
+                if isinstance(result, BaseException):
+                    failed.append(f"{creds.name}: {result}")
+                    delay = self._xtream_retry.get(key, (0.0, 0.0))[1]
+                    delay = min(delay * 2, _XTREAM_RETRY_MAX_SECS) if delay else _XTREAM_RETRY_SECS
+                    self._xtream_retry[key] = (time.monotonic() + delay, delay)
+                    continue
+                self._xtream_retry.pop(key, None)
+                if self._store_provider_playlist(result[1], add=force):
+                    changed = True
+        if changed:
+            self._schedule_refresh()
+        msg = f"Refreshed {len(providers) - len(failed)} of {len(providers)} providers"
+        if not force:
+            for line in failed:
+                print(f"Background refresh failed for {line}")
+        elif failed:
+            QMessageBox.warning(self, "Refresh", msg + "\n\n" + "\n".join(failed))
+        else:
+            QMessageBox.information(self, "Refresh", msg)
+
+    async def _fetch_provider_shared(self, creds: XtreamCredentials):
+        """Like _fetch_provider, but joins a download already running for these credentials."""
+        key = (creds.server, creds.username, creds.password)
+        task = self._xtream_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_provider(creds))
+            self._xtream_inflight[key] = task
+            task.add_done_callback(lambda _t: self._xtream_inflight.pop(key, None))
+        # Shielded so one caller going away does not cancel the others' download
+        return await asyncio.shield(task)
+
+    async def _fetch_provider(self, creds: XtreamCredentials):
+        """Authenticate and download one provider's catalogue; returns (account info, playlist)."""
+        client = XtreamCodesClient(creds)
+        # Every API call carries the credentials, so the catalogue download
+        # does not need to wait for the account check to finish
+        channels_task = asyncio.create_task(client.get_all_channels())
+        try:
+            info = await client.authenticate()
+        except Exception:
+            channels_task.cancel()
+            raise
+        channels = await channels_task
+        return info, Playlist(
+            name=creds.name,
+            source=creds.server,
+            channels=channels,
+            metadata=creds.to_dict(),
+        )
+
+    def _stored_provider_playlist(self, server: str, username: str):
+        """The stored playlist downloaded for this provider, if any."""
+        return next(
+            (p for p in self._state.get_playlists_by_source(server)
+             if p.metadata.get("username") == username),
+            None,
+        )
+
+    def _provider_fetched_at(self, creds: XtreamCredentials) -> float:
+        """Wall-clock time of the provider's last stored download.
+
+        Providers without a stored playlist report +inf, so they are never due
+        for a background refresh.
+        """
+        pl = self._stored_provider_playlist(creds.server, creds.username)
+        return pl.metadata.get("fetched_at", 0.0) if pl else float("inf")
+
+    def _store_provider_playlist(self, pl: Playlist, add: bool = True) -> bool:
+        """Add a provider playlist, or update the one from an earlier download.
+
+        The fetch time and catalogue digest go into the playlist metadata, which
+        is saved with the playlist, so the refresh TTL holds across restarts.
+        Returns False, leaving the channels untouched, when the catalogue is the
+        same as the one stored last time, or when there is no stored playlist
+        and ``add`` is False.
+        """
+        digest = _channels_digest(pl.channels).hex()
+        pl.metadata["fetched_at"] = time.time()
+        pl.metadata["digest"] = digest
+        old = self._stored_provider_playlist(pl.source, pl.metadata.get("username"))
+        if old is None:
+            if not add:
+                return False
+            self._state.add_playlist(pl)
+        elif old.metadata.get("digest") == digest:
+            # Saved with the next playlist write; at worst one extra refresh after a restart
+            old.metadata["fetched_at"] = pl.metadata["fetched_at"]
+            return False
+        else:
+            # Merge in place so unchanged channels (and their rows) survive
+            self._state.update_playlist(old, pl)
+        return True
+
     def _remove_playlist_prompt(self, item: QListWidgetItem):
         pl = item.data(Qt.UserRole)
         if pl and QMessageBox.question(self, "Remove Playlist", f"Remove {pl.name}?") == QMessageBox.Yes:
             self._state.remove_playlist(pl)
-            self._refresh_lists()
+            self._playlist_items.pop(id(pl), None)
+            self._playlist_list.takeItem(self._playlist_list.row(item))
+            self._update_empty_state()
 
     def _remove_provider_prompt(self, item: QListWidgetItem):
         p = item.data(Qt.UserRole)
         if p and QMessageBox.question(self, "Remove Provider", f"Remove {p.get('name')}?") == QMessageBox.Yes:
-            self._state.remove_xtream_provider(p.get("server", ""), p.get("username", ""))
-            self._refresh_lists()
+            key = (p.get("server", ""), p.get("username", ""))
+            self._state.remove_xtream_provider(*key)
+            self._provider_items.pop(key, None)
+            self._provider_list.takeItem(self._provider_list.row(item))
+            self._update_empty_state()
 
     def _clear_favorites(self):
         self._state.clear_favorites()
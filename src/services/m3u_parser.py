@@ -1,12 +1,43 @@
 """M3U/M3U8 playlist parser with support for large files and content type detection."""
+import io
+import os
 import re
+import asyncio
+import tempfile
 import httpx
-import aiofiles
-from typing import List, Optional, Callable
+from typing import Iterable, List, Optional, Callable
 from ..models.channel import Channel
 from ..models.playlist import Playlist
 
 
+def _any_of(patterns: List[str]) -> "re.Pattern[str]":
+    """Compile a pattern list into one case-insensitive alternation."""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+
+
+# EXTINF attribute and name patterns, compiled once for the per-line parse loop
+_TVG_NAME_RE = re.compile(r'tvg-name="([^"]*)"', re.IGNORECASE)
+_TVG_LOGO_RE = re.compile(r'tvg-logo="([^"]*)"', re.IGNORECASE)
+_LOGO_RE = re.compile(r'logo="([^"]*)"', re.IGNORECASE)
+_GROUP_TITLE_RE = re.compile(r'group-title="([^"]*)"', re.IGNORECASE)
+_TVG_ID_RE = re.compile(r'tvg-id="([^"]*)"', re.IGNORECASE)
+_TRAILING_NAME_RE = re.compile(r',\s*([^,]+)$')
+_TVG_ATTR_RE = re.compile(r'tvg-\w+="[^"]*"')
+_SPACES_RE = re.compile(r'\s+')
+_SXXEXX_RE = re.compile(r's(\d{1,2})\s*e(\d{1,2})', re.IGNORECASE)
+_SEASON_RE = re.compile(r'season\s*(\d+)', re.IGNORECASE)
+_EPISODE_RE = re.compile(r'(?:episode|ep)\s*(\d+)', re.IGNORECASE)
+_NAME_SEPARATORS_RE = re.compile(r'[.\-_]')
+_EPISODE_TAG_RE = re.compile(r'E\d+')
+_YEAR_RE = re.compile(r'\d{4}')
+
+# Inline category headers such as "★★★ SPORTS ★★★"
+_HEADER_LEADING_RE = re.compile(r'^([^\w\s]+)')
+_HEADER_TRAILING_RE = re.compile(r'([^\w\s]+)$')
+_HEADER_SEP_START_RE = re.compile(r'^[|│\]\[\-–—=]+\s*')
+_HEADER_SEP_END_RE = re.compile(r'\s*[|│\]\[\-–—=]+$')
+
+
 class M3UParser:
     """Parser for M3U and M3U8 playlist files - optimized for large files."""
     
@@ -64,48 +95,96 @@ class M3UParser:
         r'\b(bluray|bdrip|webrip|hdtv|dvdrip)\b',
     ]
     
+    # Compiled forms of the lists above; "any pattern matches" checks use a
+    # single alternation, movie name indicators are counted per pattern
+    _SERIES_NAME_RE = _any_of(SERIES_NAME_PATTERNS)
+    _SERIES_GROUP_RE = _any_of(SERIES_GROUP_PATTERNS)
+    _MOVIE_GROUP_RE = _any_of(MOVIE_GROUP_PATTERNS)
+    _LIVE_GROUP_RE = _any_of(LIVE_GROUP_PATTERNS)
+    _LIVE_GROUP_HEAD_RE = _any_of(LIVE_GROUP_PATTERNS[:6])
+    _MOVIE_NAME_RES = [re.compile(p, re.IGNORECASE) for p in MOVIE_NAME_PATTERNS]
+    
+    # Shared client so repeated adds reuse pooled connections and DNS lookups
+    _client: Optional[httpx.AsyncClient] = None
+    
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Get or create the shared HTTP client used for playlist downloads."""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(cls.TIMEOUT, connect=30.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=5,
+                    max_connections=10,
+                ),
+                follow_redirects=True,
+            )
+        return cls._client
+    
     @classmethod
     async def parse_from_url(
         cls, 
         url: str,
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        stream_to_disk: bool = True,
     ) -> Playlist:
-        """Parse an M3U playlist from a URL with retry logic."""
+        """Parse an M3U playlist from a URL with retry logic.
+        
+        With ``stream_to_disk`` the body is spooled to a temporary file and
+        parsed line by line, so a large playlist is never held in memory as
+        one bytes object plus its decoded copy.
+        """
         content = None
+        spool = None
         last_error = None
         
         for attempt in range(cls.MAX_RETRIES):
+            sink = tempfile.TemporaryFile() if stream_to_disk else None
             try:
-                # Configure client with extended timeout and limits
-                limits = httpx.Limits(
-                    max_keepalive_connections=5,
-                    max_connections=10,
-                )
-                timeout = httpx.Timeout(cls.TIMEOUT, connect=30.0)
-                
-                async with httpx.AsyncClient(
-                    timeout=timeout,
-                    limits=limits,
-                    follow_redirects=True,
-                ) as client:
-                    # Stream the response for large files
-                    async with client.stream('GET', url) as response:
-                        response.raise_for_status()
-                        
-                        total_size = int(response.headers.get('content-length', 0))
-                        downloaded = 0
-                        chunks = []
-                        
+                client = cls._get_client()
+                # Stream the response for large files
+                async with client.stream('GET', url) as response:
+                    response.raise_for_status()
+
+                    total_size = int(response.headers.get('content-length', 0))
+                    downloaded = 0
+                    chunks = []
+
+                    # Chunked responses carry no length; probe it with a HEAD
+                    # request that runs alongside the body download
+                    size_task = None
+                    if progress_callback and total_size == 0:
+                        size_task = asyncio.create_task(cls._probe_content_length(client, url))
+
+                    try:
                         async for chunk in response.aiter_bytes(chunk_size=cls.CHUNK_SIZE):
-                            chunks.append(chunk)
+                            if sink is not None:
+                                sink.write(chunk)
+                            else:
+                                chunks.append(chunk)
                             downloaded += len(chunk)
-                            
-                            if progress_callback and total_size > 0:
+
+                            if size_task is not None and size_task.done():
+                                total_size = size_task.result()
+                                size_task = None
+
+                            if progress_callback and total_size > downloaded:
                                 progress_callback(downloaded, total_size)
-                        
+                    finally:
+                        if size_task is not None:
+                            size_task.cancel()
+
+                    # Always report completion, including for bodies whose
+                    # length never became known
+                    if progress_callback:
+                        progress_callback(downloaded, downloaded)
+
+                    if sink is not None:
+                        spool, sink = sink, None
+                    else:
                         content = b''.join(chunks).decode('utf-8', errors='ignore')
-                        break  # Success, exit retry loop
-                        
+                    break  # Success, exit retry loop
+
             except httpx.TimeoutException:
                 last_error = f"Timeout (attempt {attempt + 1}/{cls.MAX_RETRIES})"
             except httpx.HTTPStatusError as e:
@@ -113,20 +192,27 @@ class M3UParser:
                 break  # Don't retry on HTTP errors
             except Exception as e:
                 last_error = str(e)
+            finally:
+                # Discard a partial spool from a failed attempt
+                if sink is not None:
+                    sink.close()
             
             # Wait before retry
             if attempt < cls.MAX_RETRIES - 1:
-                import asyncio
                 await asyncio.sleep(2)
         
-        if content is None:
+        if content is None and spool is None:
             raise Exception(f"Failed to download playlist: {last_error}")
         
-        # Parse the content
-        channels = cls._parse_content(content)
+        # Parse in a worker thread so the caller's "parsing" status keeps painting
+        loop = asyncio.get_running_loop()
+        if spool is not None:
+            channels = await loop.run_in_executor(None, cls._parse_spool, spool)
+        else:
+            channels = await loop.run_in_executor(None, cls._parse_content, content)
         
         # Create playlist
-        name = cls._extract_playlist_name(url, content)
+        name = cls._extract_playlist_name(url, content or "")
         
         return Playlist(
             name=name,
@@ -134,19 +220,47 @@ class M3UParser:
             channels=channels
         )
     
+    @classmethod
+    def _parse_spool(cls, spool) -> List[Channel]:
+        """Parse a downloaded playlist spooled to a binary temp file, then close it."""
+        spool.seek(0)
+        with io.TextIOWrapper(spool, encoding='utf-8', errors='ignore') as text:
+            return cls._parse_lines(text)
+    
+    @classmethod
+    async def _probe_content_length(cls, client: httpx.AsyncClient, url: str) -> int:
+        """Return the size reported by a HEAD request, or 0 if unavailable."""
+        try:
+            response = await client.head(url)
+            # A compressed length would not match the decoded bytes we count
+            if not response.is_success or 'content-encoding' in response.headers:
+                return 0
+            return int(response.headers.get('content-length', 0))
+        except Exception:
+            return 0
+    
     @classmethod
     async def parse_from_file(cls, file_path: str) -> Playlist:
-        """Parse an M3U playlist from a local file."""
+        """Parse an M3U playlist from a local file without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, cls.parse_from_file_sync, file_path)
+    
+    @classmethod
+    def parse_from_file_sync(cls, file_path: str) -> Playlist:
+        """Parse an M3U playlist from a local file (blocking; run in a worker thread).
+
+        The file is parsed line by line as it is read, so a large playlist is
+        never held in memory as one string plus its list of lines.
+        """
         try:
-            async with aiofiles.open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = await f.read()
+            f = open(file_path, 'r', encoding='utf-8', errors='ignore')
         except Exception as e:
             raise Exception(f"Failed to read file: {e}")
         
-        channels = cls._parse_content(content)
+        with f:
+            channels = cls._parse_lines(f)
         
         # Extract name from filename
-        import os
         name = os.path.splitext(os.path.basename(file_path))[0]
         
         return Playlist(
@@ -167,20 +281,20 @@ class M3UParser:
             return False, ""
 
         # Leading decorative chars (non-alphanumeric, non-space)
-        leading = re.match(r'^([^\w\s]+)', name)
+        leading = _HEADER_LEADING_RE.match(name)
         if not leading or len(leading.group(1)) < 3:
             return False, ""
 
         # Trailing decorative chars
-        trailing = re.search(r'([^\w\s]+)$', name)
+        trailing = _HEADER_TRAILING_RE.search(name)
         if not trailing or len(trailing.group(1)) < 3:
             return False, ""
 
         # Extract middle text
         middle = name[leading.end():trailing.start()].strip()
         # Strip separators like | ] [ etc.
-        middle = re.sub(r'^[|│\]\[\-–—=]+\s*', '', middle)
-        middle = re.sub(r'\s*[|│\]\[\-–—=]+$', '', middle)
+        middle = _HEADER_SEP_START_RE.sub('', middle)
+        middle = _HEADER_SEP_END_RE.sub('', middle)
         middle = middle.strip()
 
         if middle and len(middle) > 1:
@@ -190,8 +304,12 @@ class M3UParser:
     @classmethod
     def _parse_content(cls, content: str) -> List[Channel]:
         """Parse M3U content and return list of channels."""
+        return cls._parse_lines(content.splitlines())
+
+    @classmethod
+    def _parse_lines(cls, lines: Iterable[str]) -> List[Channel]:
+        """Parse M3U lines (a list or an open text file) into channels."""
         channels = []
-        lines = content.splitlines()
 
         current_extinf = None
         detected_category = ""
@@ -240,37 +358,30 @@ class M3UParser:
             return 'live'
         
         # Check for series patterns in name (high priority)
-        for pattern in cls.SERIES_NAME_PATTERNS:
-            if re.search(pattern, name_lower, re.IGNORECASE):
-                return 'series'
+        if cls._SERIES_NAME_RE.search(name_lower):
+            return 'series'
         
         # Check group patterns for series
-        for pattern in cls.SERIES_GROUP_PATTERNS:
-            if re.search(pattern, group_lower, re.IGNORECASE):
-                return 'series'
+        if cls._SERIES_GROUP_RE.search(group_lower):
+            return 'series'
         
         # Check for movie patterns in name
         movie_indicators = 0
-        for pattern in cls.MOVIE_NAME_PATTERNS:
-            if re.search(pattern, name_lower, re.IGNORECASE):
+        for pattern in cls._MOVIE_NAME_RES:
+            if pattern.search(name_lower):
                 movie_indicators += 1
         
-        # Check group patterns for movies
-        for pattern in cls.MOVIE_GROUP_PATTERNS:
-            if re.search(pattern, group_lower, re.IGNORECASE):
-                # If group contains movie patterns and not live patterns
-                is_live = any(re.search(p, group_lower, re.IGNORECASE) for p in cls.LIVE_GROUP_PATTERNS[:6])
-                if not is_live:
-                    return 'movie'
+        # Check group patterns for movies, unless the group also looks live
+        if cls._MOVIE_GROUP_RE.search(group_lower) and not cls._LIVE_GROUP_HEAD_RE.search(group_lower):
+            return 'movie'
         
         # If multiple movie indicators in name and no clear live patterns
         if movie_indicators >= 2:
             return 'movie'
         
         # Check group patterns for live TV
-        for pattern in cls.LIVE_GROUP_PATTERNS:
-            if re.search(pattern, group_lower, re.IGNORECASE):
-                return 'live'
+        if cls._LIVE_GROUP_RE.search(group_lower):
+            return 'live'
         
         # Default to live for anything else (traditional TV channels)
         return 'live'
@@ -292,7 +403,7 @@ class M3UParser:
             # If name is empty or still contains attributes, try tvg-name
             if not name or 'tvg-' in name.lower() or '="' in name:
                 # Try tvg-name attribute
-                tvg_name_match = re.search(r'tvg-name="([^"]*)"', extinf_line, re.IGNORECASE)
+                tvg_name_match = _TVG_NAME_RE.search(extinf_line)
                 if tvg_name_match and tvg_name_match.group(1):
                     name = tvg_name_match.group(1)
             
@@ -300,7 +411,7 @@ class M3UParser:
             if not name or 'tvg-' in name.lower():
                 # Last resort - try to find any readable name
                 # Look for the actual display name after attributes
-                match = re.search(r',\s*([^,]+)$', extinf_line)
+                match = _TRAILING_NAME_RE.search(extinf_line)
                 if match:
                     potential_name = match.group(1).strip()
                     if potential_name and 'tvg-' not in potential_name.lower():
@@ -309,31 +420,31 @@ class M3UParser:
             # Clean up the name
             if name:
                 # Remove any remaining attribute-like patterns
-                name = re.sub(r'tvg-\w+="[^"]*"', '', name).strip()
-                name = re.sub(r'\s+', ' ', name).strip()
+                name = _TVG_ATTR_RE.sub('', name).strip()
+                name = _SPACES_RE.sub(' ', name).strip()
             
             if not name:
                 name = "Unknown Channel"
             
             # Extract logo - check both tvg-logo and logo
             logo = ""
-            logo_match = re.search(r'tvg-logo="([^"]*)"', extinf_line, re.IGNORECASE)
+            logo_match = _TVG_LOGO_RE.search(extinf_line)
             if logo_match:
                 logo = logo_match.group(1)
             else:
-                logo_match = re.search(r'logo="([^"]*)"', extinf_line, re.IGNORECASE)
+                logo_match = _LOGO_RE.search(extinf_line)
                 if logo_match:
                     logo = logo_match.group(1)
             
             # Extract group from group-title attribute, fall back to detected inline category
             group = detected_category or "Uncategorized"
-            group_match = re.search(r'group-title="([^"]*)"', extinf_line, re.IGNORECASE)
+            group_match = _GROUP_TITLE_RE.search(extinf_line)
             if group_match and group_match.group(1):
                 group = group_match.group(1)
             
             # Extract tvg-id for EPG
             tvg_id = ""
-            tvg_id_match = re.search(r'tvg-id="([^"]*)"', extinf_line, re.IGNORECASE)
+            tvg_id_match = _TVG_ID_RE.search(extinf_line)
             if tvg_id_match:
                 tvg_id = tvg_id_match.group(1)
             
@@ -347,25 +458,25 @@ class M3UParser:
             
             if content_type == 'series':
                 # Try to extract season/episode
-                se_match = re.search(r's(\d{1,2})\s*e(\d{1,2})', name, re.IGNORECASE)
+                se_match = _SXXEXX_RE.search(name)
                 if se_match:
                     season = int(se_match.group(1))
                     episode = int(se_match.group(2))
                     # Extract series name: everything before SxxExx
                     series_name = name[:se_match.start()].strip()
                     # Clean up series name 
-                    series_name = re.sub(r'[.\-_]', ' ', series_name).strip()
-                    series_name = re.sub(r'\s+', ' ', series_name).title()
+                    series_name = _NAME_SEPARATORS_RE.sub(' ', series_name).strip()
+                    series_name = _SPACES_RE.sub(' ', series_name).title()
                 else:
                     # Try season pattern
-                    season_match = re.search(r'season\s*(\d+)', name, re.IGNORECASE)
+                    season_match = _SEASON_RE.search(name)
                     if season_match:
                         season = int(season_match.group(1))
                         # Series name might be before "Season X"
                         series_name = name[:season_match.start()].strip()
                     
                     # Try episode pattern
-                    ep_match = re.search(r'(?:episode|ep)\s*(\d+)', name, re.IGNORECASE)
+                    ep_match = _EPISODE_RE.search(name)
                     if ep_match:
                         episode = int(ep_match.group(1))
                         if not season: # If we haven't found season yet
@@ -382,8 +493,8 @@ class M3UParser:
                  if content_type == 'series':
                      series_name = name
                      # Try to remove episode info manually if regex failed
-                     series_name = re.sub(r'E\d+', '', series_name).strip()
-                     series_name = re.sub(r'\d{4}', '', series_name).strip() # Remove year
+                     series_name = _EPISODE_TAG_RE.sub('', series_name).strip()
+                     series_name = _YEAR_RE.sub('', series_name).strip() # Remove year
 
             # Ensure normalized series name
             if 'series_name' not in locals() or not series_name:
@@ -410,7 +521,6 @@ class M3UParser:
     @classmethod
     def _extract_playlist_name(cls, url: str, content: str) -> str:
         """Extract playlist name from URL or content."""
-        import os
         from urllib.parse import urlparse
         
         parsed = urlparse(url)
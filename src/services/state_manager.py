@@ -1,10 +1,12 @@
 """State management service for the IPTV player."""
 import json
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional, Set, Callable, Dict, TYPE_CHECKING
 from ..models.channel import Channel
 from ..models.playlist import Playlist
+from .xtream_client import normalize_server
 
 try:
     import keyring
@@ -53,12 +55,19 @@ class StateManager:
         self._channel_by_url: Dict[str, Channel] = {}
         self._channels_by_type: Dict[str, List[Channel]] = {"live": [], "movie": [], "series": []}
         self._index_dirty: bool = True
+        # Kept in step with _playlists; several Xtream accounts may share a source
+        self._playlists_by_source: Dict[str, List[Playlist]] = {}
         
         # Callbacks
         self._on_playlist_change: List[Callable] = []
         self._on_favorites_change: List[Callable] = []
         self._on_channel_change: List[Callable] = []
         
+        # batch_update() nesting depth and deferred work
+        self._batch_depth = 0
+        self._batch_save_pending = False
+        self._batch_notify_pending = False
+        
         # Load persisted data
         self._load_data()
     
@@ -83,10 +92,15 @@ class StateManager:
         if self._playlists_file.exists():
             try:
                 data = json.loads(self._playlists_file.read_text())
+                needs_save = False
                 for p_data in data.get("playlists", []):
                     playlist = self._load_playlist_from_cache(p_data)
                     if playlist:
+                        needs_save |= self._normalize_xtream_playlist(playlist)
                         self._playlists.append(playlist)
+                        self._playlists_by_source.setdefault(playlist.source, []).append(playlist)
+                if needs_save:
+                    self._save_playlists()
             except Exception:
                 pass
         
@@ -102,6 +116,19 @@ class StateManager:
         # Load playback positions
         self._load_playback_positions()
     
+    @staticmethod
+    def _normalize_xtream_playlist(playlist: Playlist) -> bool:
+        """Migrate an Xtream playlist saved with a raw server spelling; True if changed."""
+        metadata = playlist.metadata or {}
+        if "username" not in metadata or "server" not in metadata:
+            return False
+        server = normalize_server(metadata["server"])
+        if server == metadata["server"] and server == playlist.source:
+            return False
+        metadata["server"] = server
+        playlist.source = server
+        return True
+
     def _load_playlist_from_cache(self, p_data: dict) -> Optional[Playlist]:
         """Load a playlist from cache, with inline category header migration."""
         try:
@@ -213,6 +240,9 @@ class StateManager:
     
     def _save_playlists(self):
         """Save playlists to file with channel caching."""
+        if self._batch_depth:
+            self._batch_save_pending = True
+            return
         playlists_data = []
         
         for i, playlist in enumerate(self._playlists):
@@ -267,21 +297,65 @@ class StateManager:
                 channel.is_favorite = True
         
         self._playlists.append(playlist)
+        self._playlists_by_source.setdefault(playlist.source, []).append(playlist)
         self._index_dirty = True
         self._save_playlists()
         self._notify_playlist_change()
     
     def remove_playlist(self, playlist: Playlist):
         """Remove a playlist from the state."""
-        if playlist in self._playlists:
-            self._playlists.remove(playlist)
-            self._save_playlists()
-            self._notify_playlist_change()
+        # Match by identity first; dataclass equality compares whole channel lists
+        index = next((i for i, p in enumerate(self._playlists) if p is playlist), None)
+        if index is None:
+            if playlist not in self._playlists:
+                return
+            index = self._playlists.index(playlist)
+        removed = self._playlists.pop(index)
+        bucket = self._playlists_by_source.get(removed.source, [])
+        for i, p in enumerate(bucket):
+            if p is removed:
+                del bucket[i]
+                break
+        if not bucket:
+            self._playlists_by_source.pop(removed.source, None)
+        self._index_dirty = True
+        self._save_playlists()
+        self._notify_playlist_change()
+    
+    def update_playlist(self, playlist: Playlist, fresh: Playlist):
+        """Bring a stored playlist up to date with a freshly downloaded copy, in place.
+        
+        Channels whose listing is unchanged keep their existing objects, so
+        references held elsewhere (views, current channel) stay valid; only new
+        or changed entries are taken from ``fresh``.
+        """
+        existing = {ch.url: ch for ch in playlist.channels}
+        merged = []
+        for ch in fresh.channels:
+            old = existing.get(ch.url)
+            if old is not None and (old.name, old.logo, old.group, old.content_type) == (
+                ch.name, ch.logo, ch.group, ch.content_type
+            ):
+                merged.append(old)
+            else:
+                if ch.url in self._favorites:
+                    ch.is_favorite = True
+                merged.append(ch)
+        playlist.channels[:] = merged
+        playlist.name = fresh.name
+        playlist.metadata = fresh.metadata
+        self._index_dirty = True
+        self._save_playlists()
+        self._notify_playlist_change()
     
     def get_playlists(self) -> List[Playlist]:
         """Get all playlists."""
         return self._playlists
     
+    def get_playlists_by_source(self, source: str) -> List[Playlist]:
+        """Get the playlists loaded from a URL, file path or Xtream server."""
+        return list(self._playlists_by_source.get(source, ()))
+    
     def get_all_channels(self, playlist_filter: Optional[str] = None) -> List[Channel]:
         """Get all channels, optionally filtered by playlist name."""
         channels = []
@@ -378,6 +452,26 @@ class StateManager:
         self._recently_viewed.clear()
         self._save_recently_viewed()
     
+    @contextmanager
+    def batch_update(self):
+        """Coalesce playlist saves and change notifications until the block exits.
+        
+        Several playlist/provider mutations inside the block cost one playlist
+        cache write and one notification instead of one per call.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._batch_save_pending:
+                    self._batch_save_pending = False
+                    self._save_playlists()
+                if self._batch_notify_pending:
+                    self._batch_notify_pending = False
+                    self._notify_playlist_change()
+    
     # Callbacks
     def on_playlist_change(self, callback: Callable):
         """Register callback for playlist changes."""
@@ -408,6 +502,9 @@ class StateManager:
     def _notify_playlist_change(self):
         """Notify all playlist change callbacks."""
         self._index_dirty = True
+        if self._batch_depth:
+            self._batch_notify_pending = True
+            return
         for callback in self._on_playlist_change:
             callback()
     
@@ -454,7 +551,8 @@ class StateManager:
         if self._xtream_file.exists():
             try:
                 data = json.loads(self._xtream_file.read_text())
-                loaded = []
+                loaded: Dict[tuple, dict] = {}
+                legacy_keys = []
                 needs_save = False
 
                 for provider in data.get("providers", []):
@@ -470,12 +568,33 @@ class StateManager:
                         needs_save = True
 
                     item["password"] = self._get_xtream_password(server, username)
-                    loaded.append(item)
 
-                self._xtream_providers = loaded
+                    # Legacy migration: servers saved before normalization; the
+                    # password moves to the normalized key on save
+                    if server and normalize_server(server) != server:
+                        item["server"] = normalize_server(server)
+                        legacy_keys.append((server, item["server"], username))
+                        needs_save = True
+
+                    # Spellings that normalize alike collapse into one provider,
+                    # keeping whichever password is known
+                    key = (item.get("server", ""), username)
+                    if key in loaded:
+                        password = item["password"] or loaded[key].get("password", "")
+                        loaded[key].update(item)
+                        loaded[key]["password"] = password
+                        needs_save = True
+                    else:
+                        loaded[key] = item
+
+                self._xtream_providers = list(loaded.values())
 
                 if needs_save:
                     self._save_xtream_providers()
+                # Only now is the password stored under the normalized key
+                for old_server, new_server, username in legacy_keys:
+                    if self._xtream_secret_key(old_server, username) != self._xtream_secret_key(new_server, username):
+                        self._delete_xtream_password(old_server, username)
             except Exception:
                 self._xtream_providers = []
     
@@ -495,20 +614,23 @@ class StateManager:
     
     def add_xtream_provider(self, credentials: "XtreamCredentials"):
         """Add an Xtream Codes provider."""
+        item = credentials.to_dict()
+        item["server"] = normalize_server(credentials.server)
         # Check if provider already exists (by server+username)
         for provider in self._xtream_providers:
-            if provider.get("server") == credentials.server and provider.get("username") == credentials.username:
+            if provider.get("server") == item["server"] and provider.get("username") == credentials.username:
                 # Update existing
-                provider.update(credentials.to_dict())
+                provider.update(item)
                 self._save_xtream_providers()
                 return
         
-        self._xtream_providers.append(credentials.to_dict())
+        self._xtream_providers.append(item)
         self._save_xtream_providers()
         self._notify_playlist_change()
     
     def remove_xtream_provider(self, server: str, username: str):
         """Remove an Xtream Codes provider."""
+        server = normalize_server(server)
         self._xtream_providers = [
             p for p in self._xtream_providers
             if not (p.get("server") == server and p.get("username") == username)
@@ -1,11 +1,28 @@
 """Xtream Codes API client for IPTV providers."""
+import asyncio
+import json
 import httpx
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 from dataclasses import dataclass
+from urllib.parse import urlsplit, urlunsplit
 from ..models.channel import Channel
 
 
+def normalize_server(server: str) -> str:
+    """Canonical form of a server URL: http(s) scheme, lower-case host, no trailing slash.
+
+    Used wherever a server is stored or compared, so "Example.com:8080/" and
+    "http://example.com:8080" name the same provider.
+    """
+    server = server.strip()
+    # Add http:// if no protocol specified
+    if not server.lower().startswith(('http://', 'https://')):
+        server = f'http://{server}'
+    parts = urlsplit(server)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), '', ''))
+
+
 @dataclass
 class XtreamCredentials:
     """Xtream Codes API credentials."""
@@ -65,26 +82,41 @@ class XtreamCodesClient:
         "Connection": "keep-alive",
     }
     
+    # One pooled client for every provider, so the concurrent catalogue
+    # requests and later series lookups reuse connections and TLS sessions
+    _client: Optional[httpx.AsyncClient] = None
+    
     def __init__(self, credentials: XtreamCredentials):
         self.credentials = credentials
-        # Normalize the server URL
-        server = credentials.server.strip().rstrip('/')
-        # Add http:// if no protocol specified
-        if not server.startswith('http://') and not server.startswith('https://'):
-            server = f'http://{server}'
-        self._base_url = server
+        self._base_url = normalize_server(credentials.server)
     
-    def _create_client(self) -> httpx.AsyncClient:
+    @classmethod
+    def _create_client(cls) -> httpx.AsyncClient:
         """Create configured HTTP client."""
         allow_insecure_ssl = os.getenv("IPTV_INSECURE_SSL", "0").lower() in {"1", "true", "yes"}
         return httpx.AsyncClient(
-            timeout=self.TIMEOUT,
+            timeout=cls.TIMEOUT,
             follow_redirects=True,
-            headers=self.DEFAULT_HEADERS,
+            headers=cls.DEFAULT_HEADERS,
             verify=not allow_insecure_ssl,
             http2=False,   # Force HTTP/1.1 for better compatibility
+            # Refresh All fans out four requests per provider (account check
+            # plus three catalogue calls) for up to 8 providers at once; cap
+            # the sockets there and keep idle ones for the next refresh
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=8,
+                keepalive_expiry=60.0,
+            ),
         )
     
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Get or create the HTTP client shared by all provider instances."""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = cls._create_client()
+        return cls._client
+    
     def _get_api_url(self, action: str, extra_params: Optional[Dict[str, str]] = None) -> str:
         """Build API URL with authentication."""
         url = f"{self._base_url}/player_api.php"
@@ -94,15 +126,33 @@ class XtreamCodesClient:
                 params += f"&{key}={value}"
         return f"{url}?{params}"
     
+    async def _get_json(self, url: str, build: Optional[Callable[[Any], Any]] = None) -> Any:
+        """GET an API URL, then decode the JSON (and run ``build`` on it) in a worker thread.
+        
+        Stream lists can run to tens of MB; decoding them on the event loop
+        would freeze the UI for the duration.
+        """
+        client = self._get_client()
+        response = await client.get(url)
+        response.raise_for_status()
+        content = response.content
+        
+        def decode():
+            data = json.loads(content)
+            return build(data) if build else data
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, decode)
+    
     async def authenticate(self) -> XtreamAccountInfo:
         """Test connection and get account information."""
         url = f"{self._base_url}/player_api.php?username={self.credentials.username}&password={self.credentials.password}"
         
         try:
-            async with self._create_client() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            client = self._get_client()
+            response = await client.get(url)
+            response.raise_for_status()
+            data = response.json()
         except httpx.ConnectError as e:
             raise Exception(f"Cannot connect to server: {self._base_url}") from e
         except httpx.TimeoutException:
@@ -136,10 +186,10 @@ class XtreamCodesClient:
         """Get all live stream categories."""
         url = self._get_api_url("get_live_categories")
         
-        async with self._create_client() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
+        client = self._get_client()
+        response = await client.get(url)
+        response.raise_for_status()
+        data = response.json()
         
         categories = []
         for item in data:
@@ -154,38 +204,33 @@ class XtreamCodesClient:
         """Get live streams, optionally filtered by category."""
         extra_params = {"category_id": category_id} if category_id else None
         url = self._get_api_url("get_live_streams", extra_params)
-        
-        async with self._create_client() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
-        
-        channels = []
-        for item in data:
-            stream_id = item.get("stream_id", "")
-            # Build the stream URL
-            stream_url = f"{self._base_url}/live/{self.credentials.username}/{self.credentials.password}/{stream_id}.ts"
-            
-            channels.append(Channel(
+        return await self._get_json(url, self._live_channels)
+    
+    def _live_channels(self, data: List[Dict[str, Any]]) -> List[Channel]:
+        # Stream URLs differ only by id; build the shared prefix once
+        prefix = f"{self._base_url}/live/{self.credentials.username}/{self.credentials.password}/"
+        return [
+            Channel(
                 name=item.get("name", "Unknown"),
-                url=stream_url,
+                url=f"{prefix}{item.get('stream_id', '')}.ts",
                 logo=item.get("stream_icon", ""),
                 group=item.get("category_name", "Live TV"),
                 tvg_id=item.get("epg_channel_id"),
                 tvg_name=item.get("name"),
                 is_favorite=False,
                 content_type="live",
-            ))
-        return channels
+            )
+            for item in data
+        ]
     
     async def get_vod_categories(self) -> List[XtreamCategory]:
         """Get all VOD categories."""
         url = self._get_api_url("get_vod_categories")
         
-        async with self._create_client() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
+        client = self._get_client()
+        response = await client.get(url)
+        response.raise_for_status()
+        data = response.json()
         
         categories = []
         for item in data:
@@ -200,37 +245,30 @@ class XtreamCodesClient:
         """Get VOD streams, optionally filtered by category."""
         extra_params = {"category_id": category_id} if category_id else None
         url = self._get_api_url("get_vod_streams", extra_params)
-        
-        async with self._create_client() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
-        
-        channels = []
-        for item in data:
-            stream_id = item.get("stream_id", "")
-            extension = item.get("container_extension", "mp4")
-            # Build the VOD URL
-            stream_url = f"{self._base_url}/movie/{self.credentials.username}/{self.credentials.password}/{stream_id}.{extension}"
-            
-            channels.append(Channel(
+        return await self._get_json(url, self._vod_channels)
+    
+    def _vod_channels(self, data: List[Dict[str, Any]]) -> List[Channel]:
+        prefix = f"{self._base_url}/movie/{self.credentials.username}/{self.credentials.password}/"
+        return [
+            Channel(
                 name=item.get("name", "Unknown"),
-                url=stream_url,
+                url=f"{prefix}{item.get('stream_id', '')}.{item.get('container_extension', 'mp4')}",
                 logo=item.get("stream_icon", ""),
                 group=f"VOD - {item.get('category_name', 'Movies')}",
                 is_favorite=False,
                 content_type="movie",
-            ))
-        return channels
+            )
+            for item in data
+        ]
     
     async def get_series_categories(self) -> List[XtreamCategory]:
         """Get all series categories."""
         url = self._get_api_url("get_series_categories")
         
-        async with self._create_client() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
+        client = self._get_client()
+        response = await client.get(url)
+        response.raise_for_status()
+        data = response.json()
         
         categories = []
         for item in data:
@@ -245,24 +283,12 @@ class XtreamCodesClient:
         """Get series list, optionally filtered by category."""
         extra_params = {"category_id": category_id} if category_id else None
         url = self._get_api_url("get_series", extra_params)
-        
-        async with self._create_client() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
-        
-        return data
+        return await self._get_json(url)
     
     async def get_series_info(self, series_id: str) -> Dict[str, Any]:
         """Get detailed series information including episodes."""
         url = self._get_api_url("get_series_info", {"series_id": series_id})
-        
-        async with self._create_client() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
-        
-        return data
+        return await self._get_json(url)
     
     def build_series_episode_url(self, episode_id: str, extension: str = "mp4") -> str:
         """Build URL for a series episode."""
@@ -274,9 +300,14 @@ class XtreamCodesClient:
         vod_task = self.get_vod_streams()
         series_task = self.get_series()
         
-        import asyncio
         results = await asyncio.gather(live_task, vod_task, series_task, return_exceptions=True)
         
+        # A section failing on its own still yields the rest of the catalogue,
+        # but with nothing fetched there is no catalogue to return: report it
+        # rather than hand back an empty list that would replace a good one
+        if not any(isinstance(r, list) for r in results):
+            raise Exception(f"Failed to fetch channels: {results[0]}")
+        
         channels = []
         # Process live results
         if isinstance(results[0], list):
@@ -1,9 +1,15 @@
+import asyncio
+import json
 import sys, os
+import tempfile
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pytest
 from src.services.m3u_parser import M3UParser
 from src.services.stream_proxy import StreamProxyServer
+from src.services.state_manager import StateManager
+from src.services.xtream_client import normalize_server
+from src.models import Channel, Playlist
 
 
 # Qt imports require a QApplication; skip if headless
@@ -16,6 +22,40 @@ def test_content_type_detection_by_url_patterns():
     assert M3UParser._detect_content_type("Live", "Any", "https://example.com/live/u/p/3.ts") == "live"
 
 
+_CRLF_M3U = (
+    '#EXTM3U\r\n'
+    '#EXTINF:-1 tvg-id="one.uk" tvg-logo="http://img/1.png" group-title="News",News One\r\n'
+    'http://example.com/live/u/p/1.ts\r\n'
+    '\r\n'
+    '#EXTINF:-1,★★★ SPORTS ★★★\r\n'
+    'http://example.com/live/u/p/header.ts\r\n'
+    '#EXTINF:-1,Sports One\r\n'
+    'http://example.com/live/u/p/2.ts\r\n'
+    '#EXTINF:-1 group-title="Movies",Film (2020)\r\n'
+    'http://example.com/movie/u/p/3.mp4\r\n'
+)
+
+
+def test_m3u_file_and_memory_parse_agree(tmp_path):
+    path = tmp_path / "crlf.m3u"
+    path.write_bytes(_CRLF_M3U.encode())
+
+    def rows(channels):
+        return [(c.name, c.url, c.group, c.logo, c.tvg_id, c.content_type) for c in channels]
+
+    from_file = rows(asyncio.run(M3UParser.parse_from_file(str(path))).channels)
+    with open(path, "rb") as f:
+        spooled = tempfile.TemporaryFile()
+        spooled.write(f.read())
+    from_spool = rows(M3UParser._parse_spool(spooled))
+    in_memory = rows(M3UParser._parse_content(_CRLF_M3U))
+
+    assert from_file == in_memory == from_spool
+    assert [r[0] for r in in_memory] == ["News One", "Sports One", "Film (2020)"]
+    assert [r[2] for r in in_memory][:2] == ["News", "SPORTS"]
+    assert all(not r[1].endswith(("\r", "\n")) for r in from_file)
+
+
 def test_stream_proxy_rejects_unsafe_urls():
     proxy = StreamProxyServer()
 
@@ -32,6 +72,92 @@ def test_stream_proxy_rejects_unsafe_urls():
         pass
 
 
+def test_xtream_server_normalization():
+    assert normalize_server("Example.com:8080/") == "http://example.com:8080"
+    assert normalize_server("HTTPS://Example.com/panel/") == "https://example.com/panel"
+
+
+class _MemoryKeyring:
+    def __init__(self):
+        self.secrets = {}
+
+    def get_password(self, service, key):
+        return self.secrets.get((service, key))
+
+    def set_password(self, service, key, password):
+        self.secrets[(service, key)] = password
+
+    def delete_password(self, service, key):
+        self.secrets.pop((service, key), None)
+
+
+def test_state_normalizes_saved_xtream_servers(tmp_path, monkeypatch):
+    import src.services.state_manager as state_module
+    keyring = _MemoryKeyring()
+    monkeypatch.setattr(state_module, "keyring", keyring)
+    (tmp_path / "xtream.json").write_text(json.dumps({"providers": [
+        {"name": "a", "server": "Example.com:8080/", "username": "u", "password": "secret"},
+        {"name": "b", "server": "http://example.com:8080", "username": "u"},
+    ]}))
+    state = StateManager(str(tmp_path))
+    providers = state.get_xtream_providers()
+    assert [(p["name"], p["server"]) for p in providers] == [("b", "http://example.com:8080")]
+    # The legacy spelling's password survives the merge and the key move
+    assert providers[0]["password"] == "secret"
+    assert list(keyring.secrets.values()) == ["secret"]
+    assert StateManager(str(tmp_path)).get_xtream_providers()[0]["password"] == "secret"
+
+    state.add_playlist(Playlist(name="a", source="Example.com:8080/",
+                                metadata={"server": "Example.com:8080/", "username": "u"}))
+    reloaded = StateManager(str(tmp_path))
+    assert len(reloaded.get_playlists_by_source("http://example.com:8080")) == 1
+
+
+def test_state_batch_update_coalesces_notifications(tmp_path):
+    state = StateManager(str(tmp_path))
+    calls = []
+    state.on_playlist_change(lambda: calls.append(1))
+
+    with state.batch_update():
+        state.add_playlist(Playlist(name="a", source="a", channels=[Channel(name="A", url="http://a/1")]))
+        state.add_playlist(Playlist(name="b", source="b"))
+        assert calls == []
+        assert not (tmp_path / "playlists.json").exists()
+
+    assert calls == [1]
+    assert len(StateManager(str(tmp_path)).get_playlists()) == 2
+
+
+def test_state_playlists_by_source(tmp_path):
+    state = StateManager(str(tmp_path))
+    first = Playlist(name="a", source="http://s", metadata={"username": "u1"})
+    second = Playlist(name="b", source="http://s", metadata={"username": "u2"})
+    state.add_playlist(first)
+    state.add_playlist(second)
+    assert state.get_playlists_by_source("http://s") == [first, second]
+
+    state.remove_playlist(first)
+    assert state.get_playlists_by_source("http://s") == [second]
+    assert StateManager(str(tmp_path)).get_playlists_by_source("http://s")[0].name == "b"
+
+
+def test_state_update_playlist_keeps_unchanged_channels(tmp_path):
+    state = StateManager(str(tmp_path))
+    kept = Channel(name="A", url="http://a/1")
+    playlist = Playlist(name="p", source="s", channels=[kept, Channel(name="B", url="http://a/2")])
+    state.add_playlist(playlist)
+
+    fresh = Playlist(name="p2", source="s", channels=[
+        Channel(name="A", url="http://a/1"), Channel(name="C", url="http://a/3"),
+    ])
+    state.update_playlist(playlist, fresh)
+
+    assert state.get_playlists() == [playlist]
+    assert playlist.name == "p2"
+    assert playlist.channels[0] is kept
+    assert [ch.url for ch in playlist.channels] == ["http://a/1", "http://a/3"]
+
+
 def test_qt_views_import():
     """Verify migrated Qt views can be imported."""
     from src.qt_views import HubView, ContentView, PlayerView, SeriesView, SettingsView
@@ -46,3 +172,10 @@ def test_qt_components_import():
     """Verify migrated Qt components can be imported."""
     from src.qt_components import VideoPlayerComponent
     assert VideoPlayerComponent is not None
+
+
+def test_series_episode_title_strips_duplicate_token():
+    from src.qt_views.series_view import _episode_title
+    assert _episode_title(Channel(name="Show - S01E01 - Pilot", url="u", season=1, episode=1)) == "S01E01  •  Show - Pilot"
+    assert _episode_title(Channel(name="Show S01E02 - Title", url="u", season=1, episode=2)) == "S01E02  •  Show - Title"
+    assert _episode_title(Channel(name="Pilot", url="u")) == "Pilot"